@@ -6,8 +6,15 @@ from routes.connexity import connexity_bp
 from routes.acpm import acpm_bp
 from routes.shortest_path import shortest_path_bp
 from routes.itineraire import itineraire_bp
+from routes.travel_time import travel_time_bp
+from services import network
+from services.matrix import travel_time_matrix
 
 app = Flask(__name__)
+# Le réseau est chargé une seule fois au démarrage puis partagé par les requêtes
+store = network.init_app(app)
+# La matrice des temps de parcours est relue depuis le disque (ou calculée) dès le démarrage
+travel_time_matrix(store.snapshot)
 # Configuration CORS plus permissive pour le développement
 CORS(app, resources={
     r"/*": {
@@ -24,6 +31,7 @@ app.register_blueprint(connexity_bp)
 app.register_blueprint(acpm_bp)
 app.register_blueprint(shortest_path_bp)
 app.register_blueprint(itineraire_bp)
+app.register_blueprint(travel_time_bp)
 
 @app.route('/')
 def index():
@@ -38,6 +46,7 @@ def index():
             'GET /acpm': 'Arbre couvrant de poids minimal (Kruskal)',
             'POST /shortest-path': 'Plus court chemin entre deux stations',
             'POST /itineraire': 'Calcul d\'itinéraire entre deux stations',
+            'GET /travel-time': 'Durée du trajet entre deux stations (matrice précalculée)',
             'GET /stations/list': 'Liste de toutes les stations uniques'
         }
     }
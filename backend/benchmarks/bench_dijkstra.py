@@ -0,0 +1,125 @@
+"""
+Compare le moteur Dijkstra actuel (prédécesseurs, graphe CSR) à l'ancienne
+implémentation qui copiait le chemin à chaque insertion dans le tas.
+
+Usage (depuis backend/) :
+    python -m benchmarks.bench_dijkstra [nombre_de_paires]
+"""
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+
+from services.dijkstra import STRATEGIES, dijkstra, euclidean_heuristic, find_route, multi_source_dijkstra
+from services.network import get_network
+
+
+def reference_dijkstra(graph, start, end):
+    """Implémentation d'origine, conservée comme référence de performance."""
+    heap = [(0, start, [start])]
+    visited = set()
+    while heap:
+        dist, current, path = heapq.heappop(heap)
+        if current == end:
+            return dist, path
+        if current in visited:
+            continue
+        visited.add(current)
+        for neighbor, weight in graph[current].items():
+            if neighbor not in visited:
+                heapq.heappush(heap, (dist + weight, neighbor, path + [neighbor]))
+    return float('inf'), []
+
+
+def run(pairs_count: int = 2000, seed: int = 42):
+    network = get_network()
+    ids = list(network.graph)
+    rng = random.Random(seed)
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(pairs_count)]
+
+    implementations = [
+        ('référence (copie du chemin)', reference_dijkstra, network.graph),
+        ('prédécesseurs + CSR', dijkstra, network.csr),
+    ]
+
+    results = {}
+    for label, func, graph in implementations:
+        start = time.perf_counter()
+        distances = [func(graph, s, e)[0] for s, e in pairs]
+        elapsed = time.perf_counter() - start
+        results[label] = (elapsed, distances)
+
+    reference, current = results.values()
+    assert reference[1] == current[1], "Les deux implémentations divergent"
+
+    # Pic mémoire sur le trajet le plus long de l'échantillon
+    longest = max(range(pairs_count), key=lambda i: current[1][i])
+    peaks = {}
+    for label, func, graph in implementations:
+        tracemalloc.start()
+        func(graph, *pairs[longest])
+        peaks[label] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(f"\n=== Dijkstra sur le graphe complet ({len(ids)} sommets, {pairs_count} paires) ===")
+    for label, (elapsed, _) in results.items():
+        print(f"{label:30s} {elapsed * 1000:9.1f} ms  ({elapsed / pairs_count * 1e6:7.1f} µs/requête, "
+              f"pic mémoire {peaks[label] / 1024:.1f} Kio)")
+    print(f"Accélération : x{reference[0] / current[0]:.2f}")
+
+    run_by_name(network, pairs_count, rng)
+    run_strategies(network, pairs_count, rng)
+
+
+def run_by_name(network, pairs_count, rng):
+    """Recherche par nom : une recherche par couple de quais contre une recherche multi-sources."""
+    names = sorted(network.name_to_ids, key=lambda name: -len(network.name_to_ids[name]))
+    # Les grandes correspondances (plusieurs quais) sont les cas défavorables
+    interchanges = names[:20]
+    pairs = [(rng.choice(interchanges), rng.choice(names)) for _ in range(pairs_count)]
+    name_to_ids, csr = network.name_to_ids, network.csr
+
+    start = time.perf_counter()
+    pairwise = []
+    for start_name, end_name in pairs:
+        pairwise.append(min(dijkstra(csr, s, e)[0]
+                            for s in name_to_ids[start_name] for e in name_to_ids[end_name]))
+    pairwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi = [multi_source_dijkstra(csr, name_to_ids[s], name_to_ids[e])[0] for s, e in pairs]
+    multi_time = time.perf_counter() - start
+
+    assert pairwise == multi, "Les deux stratégies divergent"
+    print(f"\n=== Recherche par nom depuis les {len(interchanges)} plus grandes correspondances ===")
+    print(f"{'une recherche par couple de quais':34s} {pairwise_time * 1000:9.1f} ms")
+    print(f"{'multi-sources / multi-cibles':34s} {multi_time * 1000:9.1f} ms")
+    print(f"Accélération : x{pairwise_time / multi_time:.2f}")
+
+
+
+def run_strategies(network, pairs_count, rng):
+    """Compare les stratégies sur tous les trajets, puis sur les 10 % les plus longs."""
+    names = list(network.name_to_ids)
+    name_to_ids, csr = network.name_to_ids, network.csr
+    heuristic = euclidean_heuristic(network)
+    pairs = [(name_to_ids[rng.choice(names)], name_to_ids[rng.choice(names)]) for _ in range(pairs_count)]
+    lengths = [multi_source_dijkstra(csr, s, e)[0] for s, e in pairs]
+    threshold = sorted(lengths)[int(len(lengths) * 0.9)]
+    longest = [pair for pair, length in zip(pairs, lengths) if length >= threshold]
+
+    print(f"\n=== Stratégies de recherche ({len(pairs)} trajets, dont {len(longest)} longs) ===")
+    for strategy in STRATEGIES:
+        timings = []
+        for sample in (pairs, longest):
+            start = time.perf_counter()
+            distances = [find_route(csr, s, e, strategy, heuristic)[0] for s, e in sample]
+            timings.append(time.perf_counter() - start)
+            if sample is pairs:
+                assert distances == lengths, f"La stratégie {strategy} n'est pas optimale"
+        print(f"{strategy:15s} tous : {timings[0] / len(pairs) * 1e6:7.1f} µs/requête   "
+              f"longs : {timings[1] / len(longest) * 1e6:7.1f} µs/requête")
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,10 @@
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / 'data'
+
+# Matrice des temps de parcours entre toutes les paires de stations
+TRAVEL_TIME_MATRIX_PATH = Path(os.environ.get('METRO_MATRIX_PATH', DATA_DIR / 'travel_times.bin'))
+# Nombre de processus pour le précalcul (0 : un par cœur)
+TRAVEL_TIME_MATRIX_WORKERS = int(os.environ.get('METRO_MATRIX_WORKERS', '0'))
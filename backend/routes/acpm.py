@@ -1,13 +1,13 @@
 from flask import Blueprint, jsonify
 from services.kruskal import kruskal_mst
-from utils.parser import load_data
+from services.network import get_network
 
 acpm_bp = Blueprint('acpm', __name__)
 
 @acpm_bp.route('/acpm', methods=['GET'])
 def get_mst():
     """Retourne l'arbre couvrant de poids minimal (ACPM) calculé par Kruskal."""
-    graph, positions, stations = load_data()
+    graph, positions, stations = get_network().as_tuple()
     
     # Calculer l'ACPM
     edges = []
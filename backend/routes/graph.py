@@ -1,12 +1,12 @@
 from flask import Blueprint, jsonify
-from utils.parser import load_data
+from services.network import get_network
 
 graph_bp = Blueprint('graph', __name__)
 
 @graph_bp.route('/graph', methods=['GET'])
 def get_graph():
     """Retourne le graphe complet du métro."""
-    graph, positions, stations = load_data()
+    graph, positions, stations = get_network().as_tuple()
     
     # Formater le graphe pour l'API
     formatted_graph = {}
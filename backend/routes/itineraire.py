@@ -1,11 +1,12 @@
 from flask import Blueprint, jsonify, request
-from services.dijkstra import shortest_path_by_name
-from utils.parser import load_data
+from services.dijkstra import MATRIX_STRATEGY, shortest_path_by_name
+from services.network import get_network
 from typing import Dict, List, Any, Tuple
 
 itineraire_bp = Blueprint('itineraire', __name__)
 
-def format_path_details(path: List[str], stations: Dict[str, Dict[str, Any]], positions: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+def format_path_details(path: List[str], stations: Dict[str, Dict[str, Any]], positions: Dict[str, Tuple[int, int]],
+                        graph: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
     """
     Formate les détails du chemin pour l'API.
     
@@ -13,12 +14,12 @@ def format_path_details(path: List[str], stations: Dict[str, Dict[str, Any]], po
         path: Liste des IDs des stations du chemin
         stations: Dictionnaire des stations avec leurs informations
         positions: Dictionnaire des positions des stations
+        graph: Graphe du métro, pour les temps entre stations
         
     Returns:
         Liste de dictionnaires contenant les détails de chaque étape
     """
     details = []
-    graph, _, _ = load_data()  # Récupérer le graphe pour les temps entre stations
     
     for i, station_id in enumerate(path):
         station_info = stations[station_id]
@@ -57,7 +58,8 @@ def get_itineraire():
     Body attendu:
     {
         "start": "Nom de la station de départ",
-        "end": "Nom de la station d'arrivée"
+        "end": "Nom de la station d'arrivée",
+        "strategy": "matrix" | "dijkstra" | "bidirectional" | "astar"  # optionnel, "matrix" par défaut
     }
     
     Returns:
@@ -98,15 +100,18 @@ def get_itineraire():
         start_name = data['start']
         end_name = data['end']
         
-        # Calculer l'itinéraire
-        path, total_time, start_id, end_id = shortest_path_by_name(start_name, end_name)
+        # Un seul snapshot pour toute la requête
+        network = get_network()
+        graph, positions, stations = network.as_tuple()
         
-        # Charger les données des stations pour les détails
-        _, positions, stations = load_data()
+        # Calculer l'itinéraire
+        # Par défaut, le chemin est reconstruit depuis la matrice précalculée
+        strategy = data.get('strategy', MATRIX_STRATEGY)
+        path, total_time, start_id, end_id = shortest_path_by_name(start_name, end_name, network, strategy)
         
         # Formater la réponse
         response = {
-            'path': format_path_details(path, stations, positions),
+            'path': format_path_details(path, stations, positions, graph),
             'total_time': total_time,
             'start_station': {
                 'id': start_id,
@@ -149,7 +154,7 @@ def get_stations_list():
     }
     """
     try:
-        _, _, stations = load_data()
+        stations = get_network().stations
         
         # Créer un dictionnaire pour regrouper les stations par nom
         stations_by_name = {}
@@ -1,12 +1,15 @@
 from flask import Blueprint, jsonify, request
-from services.dijkstra import dijkstra
-from utils.parser import load_data
+from services.dijkstra import DEFAULT_STRATEGY, STRATEGIES, euclidean_heuristic, find_route
+from services.network import get_network
 
 shortest_path_bp = Blueprint('shortest_path', __name__)
 
 @shortest_path_bp.route('/shortest-path', methods=['POST'])
 def get_shortest_path():
-    """Calcule le plus court chemin entre deux stations."""
+    """
+    Calcule le plus court chemin entre deux stations.
+    Accepte un champ optionnel 'strategy' : dijkstra, bidirectional ou astar.
+    """
     data = request.get_json()
     
     if not data or 'start' not in data or 'end' not in data:
@@ -17,7 +20,8 @@ def get_shortest_path():
     start_id = data['start']
     end_id = data['end']
     
-    graph, positions, stations = load_data()
+    network = get_network()
+    positions, stations = network.positions, network.stations
     
     # Vérifier que les stations existent
     if start_id not in stations or end_id not in stations:
@@ -25,8 +29,15 @@ def get_shortest_path():
             'error': 'Invalid station ID(s)'
         }), 400
     
+    strategy = data.get('strategy', DEFAULT_STRATEGY)
+    if strategy not in STRATEGIES:
+        return jsonify({
+            'error': f'Unknown strategy: {strategy}'
+        }), 400
+    
     # Calculer le plus court chemin
-    dist, path = dijkstra(graph, start_id, end_id)
+    heuristic = euclidean_heuristic(network) if strategy == 'astar' else None
+    dist, path, _, _ = find_route(network.csr, [start_id], [end_id], strategy, heuristic)
     
     if not path:
         return jsonify({
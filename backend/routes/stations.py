@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify
-from utils.parser import load_data
+from services.network import get_network
 import logging
 
 stations_bp = Blueprint('stations', __name__)
@@ -7,7 +7,7 @@ stations_bp = Blueprint('stations', __name__)
 @stations_bp.route('/stations', methods=['GET'])
 def get_stations():
     """Retourne la liste des stations avec leurs coordonnées, groupées par nom."""
-    graph, positions, stations = load_data()
+    graph, positions, stations = get_network().as_tuple()
     station_groups = {}
     for station_id, station_data in stations.items():
         name = station_data['name']
@@ -0,0 +1,52 @@
+from flask import Blueprint, jsonify, request
+from services.matrix import travel_time_matrix
+from services.network import get_network
+
+travel_time_bp = Blueprint('travel_time', __name__)
+
+@travel_time_bp.route('/travel-time', methods=['GET'])
+def get_travel_time():
+    """
+    Retourne la durée du trajet entre deux stations, lue dans la matrice
+    précalculée (aucune recherche de chemin).
+    
+    Paramètres attendus : ?from=Nom de départ&to=Nom d'arrivée
+    
+    Returns:
+    {
+        "from": "Nom de la station de départ",
+        "to": "Nom de la station d'arrivée",
+        "total_time": 300,  # en secondes
+        "start_id": "0000",
+        "end_id": "0001"
+    }
+    """
+    start_name = request.args.get('from')
+    end_name = request.args.get('to')
+    if not start_name or not end_name:
+        return jsonify({
+            'error': 'Paramètres manquants. Veuillez fournir "from" et "to"'
+        }), 400
+    
+    network = get_network()
+    for name in (start_name, end_name):
+        if name not in network.name_to_ids:
+            return jsonify({'error': f"Station '{name}' non trouvée"}), 400
+    
+    matrix = travel_time_matrix(network)
+    index = matrix.index
+    total_time, start, end = matrix.best_pair(
+        [index[i] for i in network.name_to_ids[start_name]],
+        [index[i] for i in network.name_to_ids[end_name]])
+    if start == -1:
+        return jsonify({
+            'error': f"Aucun chemin trouvé entre '{start_name}' et '{end_name}'"
+        }), 404
+    
+    return jsonify({
+        'from': start_name,
+        'to': end_name,
+        'total_time': total_time,
+        'start_id': matrix.ids[start],
+        'end_id': matrix.ids[end]
+    })
@@ -1,10 +1,39 @@
-from typing import Dict, Set, List, Tuple
-from utils.parser import load_data
+from typing import Dict, Set, List, Tuple, Optional
+from services.network import NetworkSnapshot, get_network
+from utils.graphe import CSRGraph
 import logging
 
+def reachable_from(graph, start_station: str) -> Set[str]:
+    """
+    Retourne l'ensemble des stations accessibles depuis start_station.
+
+    Args:
+        graph: Graphe au format dict {id: {voisin: poids}} ou CSRGraph
+        start_station: ID de la station de départ
+
+    Returns:
+        Set[str]: IDs des stations atteintes (start_station comprise)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph))
+    start = graph.index[start_station]
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        u = stack.pop()
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if not visited[v]:
+                visited[v] = 1
+                stack.append(v)
+    return {graph.ids[i] for i in range(len(graph)) if visited[i]}
+
 class ConnexiteChecker:
-    def __init__(self):
-        self.graph, self.positions, self.stations = load_data()
+    def __init__(self, network: Optional[NetworkSnapshot] = None):
+        self.network = network or get_network()
+        self.graph, self.positions, self.stations = self.network.as_tuple()
         self.visited: Set[str] = set()
         
     def dfs(self, start_station: str) -> None:
@@ -30,14 +59,11 @@ class ConnexiteChecker:
         Returns:
             bool: True si le graphe est connexe, False sinon
         """
-        # Réinitialiser l'ensemble des stations visitées
-        self.visited.clear()
-        
         # Choisir une station de départ arbitraire (la première du graphe)
         start_station = next(iter(self.graph))
         
-        # Lancer DFS à partir de cette station
-        self.dfs(start_station)
+        # Parcours sur le graphe CSR à partir de cette station
+        self.visited = reachable_from(self.network.csr, start_station)
         
         # Le graphe est connexe si toutes les stations ont été visitées
         return len(self.visited) == len(self.graph)
@@ -69,21 +95,14 @@ class ConnexiteChecker:
             - bool: True si toutes les stations sont accessibles depuis la station de départ
             - List[Dict]: Liste des stations non accessibles avec leurs détails
         """
-        # Réinitialiser l'ensemble des stations visitées
-        self.visited.clear()
-        
         # Trouver l'ID de la station de départ
-        start_station_id = None
-        for station_id, station_data in self.stations.items():
-            if station_data['name'] == station_name:
-                start_station_id = station_id
-                break
+        station_ids = self.network.name_to_ids.get(station_name)
         
-        if start_station_id is None:
+        if not station_ids:
             raise ValueError(f"Station '{station_name}' non trouvée")
         
-        # Lancer DFS à partir de la station spécifiée
-        self.dfs(start_station_id)
+        # Parcours sur le graphe CSR à partir de la station spécifiée
+        self.visited = reachable_from(self.network.csr, station_ids[0])
         
         # Vérifier si toutes les stations sont accessibles
         is_fully_connected = len(self.visited) == len(self.graph)
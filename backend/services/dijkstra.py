@@ -1,21 +1,302 @@
-from utils.parser import load_data
+from services.network import NetworkSnapshot, get_network
+from utils.graphe import CSRGraph
 import heapq
-from typing import Dict, List, Tuple, Any
+import math
+from typing import Callable, Dict, Iterable, List, Tuple, Any, Optional
+
+INFINITY = float('inf')
+
+def _as_csr(graph) -> CSRGraph:
+    """Accepte un graphe au format dict ou CSR et retourne sa forme CSR."""
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+
+def shortest_path_tree(graph: CSRGraph, sources: Iterable[int],
+                       targets: Iterable[int] = ()) -> Tuple[List[float], List[int], int]:
+    """
+    Dijkstra à suppression paresseuse sur les indices d'un CSRGraph.
+
+    Chaque entrée du tas n'est qu'un couple (distance, sommet) : le chemin
+    n'est jamais copié, on retient seulement le prédécesseur de chaque
+    sommet. Un voisin n'est inséré que si sa distance s'améliore strictement,
+    donc jamais une fois fixé ; les entrées obsolètes sont ignorées au pop.
+
+    Toutes les sources sont insérées à distance 0 : une seule recherche
+    couvre ainsi tous les quais d'une station de correspondance.
+
+    Args:
+        graph: Graphe CSR
+        sources: Indices des sommets de départ
+        targets: Indices des sommets d'arrivée ; la recherche s'arrête dès
+            que le premier d'entre eux est fixé (vide pour explorer tout le graphe)
+
+    Returns:
+        Tuple contenant:
+        - Liste des distances depuis les sources (INFINITY si non atteint)
+        - Liste des prédécesseurs (-1 pour les sources et les sommets non atteints)
+        - Indice de la cible atteinte (-1 si aucune)
+
+        Si des cibles sont fournies, seules la distance et le chemin de la
+        cible atteinte sont définitifs.
+    """
+    offsets, heads, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph)
+    dist = [INFINITY] * n
+    pred = [-1] * n
+    is_target = bytearray(n)
+    for t in targets:
+        is_target[t] = 1
+    heap = []
+    for source in sources:
+        dist[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+    heappop, heappush = heapq.heappop, heapq.heappush
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]:
+            # Entrée obsolète : u a déjà été fixé avec une distance plus courte
+            continue
+        if is_target[u]:
+            return dist, pred, u
+        for k in range(offsets[u], offsets[u + 1]):
+            v = heads[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heappush(heap, (nd, v))
+    return dist, pred, -1
+
+def build_path(pred: List[int], target: int) -> List[int]:
+    """Reconstruit le chemin (indices) jusqu'à target en remontant les prédécesseurs."""
+    path = [target]
+    while pred[path[-1]] != -1:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
 
 def dijkstra(graph, start, end):
-    heap = [(0, start, [start])]
-    visited = set()
+    """
+    Plus court chemin entre deux stations.
+
+    Args:
+        graph: Graphe CSR (recommandé) ou dict {id: {voisin: poids}}
+        start: ID de la station de départ
+        end: ID de la station d'arrivée
+
+    Returns:
+        Tuple (durée, liste des IDs du chemin), ou (inf, []) si aucun chemin
+    """
+    graph = _as_csr(graph)
+    dist, pred, reached = shortest_path_tree(graph, [graph.index[start]], [graph.index[end]])
+    if reached == -1:
+        return INFINITY, []
+    return dist[reached], [graph.ids[i] for i in build_path(pred, reached)]
+
+def bidirectional_search(graph: CSRGraph, sources: Iterable[int], targets: Iterable[int],
+                         heuristic: Optional['EuclideanHeuristic'] = None) -> Tuple[float, List[int]]:
+    """
+    Dijkstra bidirectionnel : une recherche depuis les sources, une autre
+    depuis les cibles (le graphe est non orienté), en développant à chaque
+    pas le côté dont le tas est le plus petit.
+
+    On s'arrête dès que la somme des minima des deux tas dépasse le meilleur
+    chemin déjà trouvé : ce chemin est alors optimal. Le paramètre heuristic
+    est ignoré ; il n'existe que pour partager la signature des stratégies.
+
+    Returns:
+        Tuple (durée, liste des indices du chemin), ou (INFINITY, []) si aucun chemin
+    """
+    offsets, heads, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph)
+    dist = ([INFINITY] * n, [INFINITY] * n)
+    pred = ([-1] * n, [-1] * n)
+    heaps = ([], [])
+    for side, nodes in ((0, sources), (1, targets)):
+        for node in nodes:
+            dist[side][node] = 0
+            heaps[side].append((0, node))
+        heapq.heapify(heaps[side])
+    for _, node in heaps[0]:
+        if dist[1][node] == 0:
+            return 0, [node]
+
+    heappop, heappush = heapq.heappop, heapq.heappush
+    best, meeting = INFINITY, -1
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        heap, side_dist, side_pred, other_dist = heaps[side], dist[side], pred[side], dist[1 - side]
+        d, u = heappop(heap)
+        if d > side_dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = heads[k]
+            nd = d + weights[k]
+            if nd < side_dist[v]:
+                side_dist[v] = nd
+                side_pred[v] = u
+                heappush(heap, (nd, v))
+                if nd + other_dist[v] < best:
+                    best, meeting = nd + other_dist[v], v
+
+    if meeting == -1:
+        return INFINITY, []
+    backward = build_path(pred[1], meeting)
+    backward.reverse()
+    return best, build_path(pred[0], meeting) + backward[1:]
+
+class EuclideanHeuristic:
+    """
+    Heuristique admissible pour A* : distance à vol d'oiseau (coordonnées de
+    pospoint.txt) divisée par la vitesse maximale observée sur les arêtes.
+
+    Comme aucune arête n'est parcourue plus vite que max_speed, la distance
+    euclidienne restante divisée par max_speed ne surestime jamais le temps
+    restant, et A* reste optimal.
+    """
+
+    def __init__(self, xs: List[float], ys: List[float], max_speed: Optional[float]):
+        self.xs = xs
+        self.ys = ys
+        self.max_speed = max_speed
+
+    @classmethod
+    def from_network(cls, network: NetworkSnapshot) -> 'EuclideanHeuristic':
+        """Calibre la vitesse maximale à partir des temps de parcours existants."""
+        graph, positions = network.csr, network.positions
+        if any(station_id not in positions for station_id in graph.ids):
+            # Sans coordonnées partout, on ne peut pas garantir l'admissibilité
+            return cls([], [], None)
+        xs = [float(positions[station_id][0]) for station_id in graph.ids]
+        ys = [float(positions[station_id][1]) for station_id in graph.ids]
+        max_speed = 0.0
+        for u, v, weight in graph.edges():
+            if weight > 0:
+                max_speed = max(max_speed, math.hypot(xs[u] - xs[v], ys[u] - ys[v]) / weight)
+        # Marge contre les erreurs d'arrondi flottant
+        return cls(xs, ys, max_speed * (1 + 1e-9) if max_speed > 0 else None)
+
+    def target_points(self, targets: Iterable[int]) -> Optional[List[Tuple[float, float]]]:
+        """Coordonnées des cibles, ou None si l'heuristique n'est pas utilisable."""
+        if self.max_speed is None:
+            return None
+        return [(self.xs[t], self.ys[t]) for t in targets]
+
+    def estimate(self, v: int, points: List[Tuple[float, float]]) -> float:
+        """Borne inférieure du temps de v à la cible la plus proche parmi points."""
+        x, y = self.xs[v], self.ys[v]
+        return min([math.hypot(x - tx, y - ty) for tx, ty in points]) / self.max_speed
+
+def astar_search(graph: CSRGraph, sources: Iterable[int], targets: Iterable[int],
+                 heuristic: Optional[EuclideanHeuristic]) -> Tuple[float, List[int]]:
+    """
+    A* multi-sources / multi-cibles guidé par une EuclideanHeuristic.
+
+    Sans heuristique utilisable, la recherche se ramène à Dijkstra.
+
+    Returns:
+        Tuple (durée, liste des indices du chemin), ou (INFINITY, []) si aucun chemin
+    """
+    targets = list(targets)
+    points = heuristic.target_points(targets) if heuristic else None
+    if points is None:
+        return _dijkstra_search(graph, sources, targets)
+
+    offsets, heads, weights = graph.offsets, graph.targets, graph.weights
+    xs, ys, inverse_speed, hypot = heuristic.xs, heuristic.ys, 1 / heuristic.max_speed, math.hypot
+    n = len(graph)
+    dist = [INFINITY] * n
+    pred = [-1] * n
+    # h(v) n'est calculé qu'une fois par sommet (-1 : pas encore calculé)
+    estimates = [-1.0] * n
+    is_target = bytearray(n)
+    for t in targets:
+        is_target[t] = 1
+    heap = []
+    for source in sources:
+        dist[source] = 0
+        heap.append((heuristic.estimate(source, points), 0, source))
+    heapq.heapify(heap)
+    heappop, heappush = heapq.heappop, heapq.heappush
     while heap:
-        dist, current, path = heapq.heappop(heap)
-        if current == end:
-            return dist, path
-        if current in visited:
+        _, d, u = heappop(heap)
+        if d > dist[u]:
             continue
-        visited.add(current)
-        for neighbor, weight in graph[current].items():
-            if neighbor not in visited:
-                heapq.heappush(heap, (dist + weight, neighbor, path + [neighbor]))
-    return float('inf'), []
+        if is_target[u]:
+            return d, build_path(pred, u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = heads[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                h = estimates[v]
+                if h < 0:
+                    x, y = xs[v], ys[v]
+                    h = INFINITY
+                    for tx, ty in points:
+                        e = hypot(x - tx, y - ty)
+                        if e < h:
+                            h = e
+                    h = estimates[v] = h * inverse_speed
+                heappush(heap, (nd + h, nd, v))
+    return INFINITY, []
+
+def _dijkstra_search(graph: CSRGraph, sources: Iterable[int], targets: Iterable[int],
+                     heuristic: Optional[EuclideanHeuristic] = None) -> Tuple[float, List[int]]:
+    dist, pred, reached = shortest_path_tree(graph, sources, targets)
+    if reached == -1:
+        return INFINITY, []
+    return dist[reached], build_path(pred, reached)
+
+# Stratégies de recherche disponibles, toutes optimales
+STRATEGIES: Dict[str, Callable[..., Tuple[float, List[int]]]] = {
+    'dijkstra': _dijkstra_search,
+    'bidirectional': bidirectional_search,
+    'astar': astar_search,
+}
+DEFAULT_STRATEGY = 'dijkstra'
+# Lecture dans la matrice précalculée (services.matrix), sans recherche
+MATRIX_STRATEGY = 'matrix'
+
+def euclidean_heuristic(network: NetworkSnapshot) -> EuclideanHeuristic:
+    """Heuristique A* du snapshot, calibrée une seule fois par version du réseau."""
+    return network.cached('euclidean_heuristic', EuclideanHeuristic.from_network)
+
+def find_route(graph, starts: Iterable[str], ends: Iterable[str], strategy: str = DEFAULT_STRATEGY,
+               heuristic: Optional[EuclideanHeuristic] = None) -> Tuple[float, List[str], Optional[str], Optional[str]]:
+    """
+    Plus court chemin entre deux ensembles de stations, en une seule recherche.
+
+    Args:
+        graph: Graphe CSR (recommandé) ou dict {id: {voisin: poids}}
+        starts: IDs de départ possibles (par exemple tous les quais d'une station)
+        ends: IDs d'arrivée possibles
+        strategy: 'dijkstra', 'bidirectional' ou 'astar'
+        heuristic: Heuristique utilisée par la stratégie 'astar'
+
+    Returns:
+        Tuple contenant:
+        - Durée du meilleur chemin (inf si aucun chemin)
+        - Liste des IDs du chemin
+        - ID de départ utilisé (None si aucun chemin)
+        - ID d'arrivée utilisé (None si aucun chemin)
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie inconnue '{strategy}' (disponibles : {', '.join(STRATEGIES)})")
+    graph = _as_csr(graph)
+    index = graph.index
+    dist, path = STRATEGIES[strategy](graph, [index[s] for s in starts], [index[e] for e in ends], heuristic)
+    if not path:
+        return INFINITY, [], None, None
+    path = [graph.ids[i] for i in path]
+    return dist, path, path[0], path[-1]
+
+def multi_source_dijkstra(graph, starts: Iterable[str], ends: Iterable[str]) -> Tuple[float, List[str], Optional[str], Optional[str]]:
+    """Raccourci pour find_route() avec la stratégie Dijkstra."""
+    return find_route(graph, starts, ends, 'dijkstra')
 
 def print_path(path, stations):
     return ' -> '.join([stations[station]['name'] for station in path])
@@ -38,13 +319,18 @@ def create_name_to_ids_mapping(stations: Dict[str, Dict[str, Any]]) -> Dict[str,
         name_to_ids[name].append(station_id)
     return name_to_ids
 
-def shortest_path_by_name(start_name: str, end_name: str) -> Tuple[List[str], int, str, str]:
+def shortest_path_by_name(start_name: str, end_name: str,
+                          network: Optional[NetworkSnapshot] = None,
+                          strategy: str = DEFAULT_STRATEGY) -> Tuple[List[str], int, str, str]:
     """
     Trouve le plus court chemin entre deux stations en tenant compte des correspondances.
     
     Args:
         start_name: Nom de la station de départ
         end_name: Nom de la station d'arrivée
+        network: Snapshot du réseau à utiliser (par défaut, le réseau partagé)
+        strategy: Stratégie de recherche ('dijkstra', 'bidirectional', 'astar'),
+            ou 'matrix' pour lire le résultat dans la matrice précalculée
         
     Returns:
         Tuple contenant:
@@ -53,8 +339,9 @@ def shortest_path_by_name(start_name: str, end_name: str) -> Tuple[List[str], in
         - ID de la station de départ utilisée
         - ID de la station d'arrivée utilisée
     """
-    graph, positions, stations = load_data()
-    name_to_ids = create_name_to_ids_mapping(stations)
+    network = network or get_network()
+    graph = network.csr
+    name_to_ids = network.name_to_ids
     
     # Vérifier que les stations existent
     if start_name not in name_to_ids:
@@ -62,20 +349,16 @@ def shortest_path_by_name(start_name: str, end_name: str) -> Tuple[List[str], in
     if end_name not in name_to_ids:
         raise ValueError(f"Station d'arrivée '{end_name}' non trouvée")
     
-    # Trouver le meilleur chemin parmi toutes les combinaisons possibles
-    best_distance = float('inf')
-    best_path = []
-    best_start_id = None
-    best_end_id = None
-    
-    for start_id in name_to_ids[start_name]:
-        for end_id in name_to_ids[end_name]:
-            distance, path = dijkstra(graph, start_id, end_id)
-            if distance < best_distance:
-                best_distance = distance
-                best_path = path
-                best_start_id = start_id
-                best_end_id = end_id
+    # Une seule recherche, depuis tous les quais de départ vers tous les quais d'arrivée
+    if strategy == MATRIX_STRATEGY:
+        # Import local : services.matrix dépend lui-même de ce module
+        from services.matrix import travel_time_matrix
+        best_distance, best_path, best_start_id, best_end_id = travel_time_matrix(network).route(
+            name_to_ids[start_name], name_to_ids[end_name])
+    else:
+        heuristic = euclidean_heuristic(network) if strategy == 'astar' else None
+        best_distance, best_path, best_start_id, best_end_id = find_route(
+            graph, name_to_ids[start_name], name_to_ids[end_name], strategy, heuristic)
     
     if best_path:
         return best_path, best_distance, best_start_id, best_end_id
@@ -83,7 +366,8 @@ def shortest_path_by_name(start_name: str, end_name: str) -> Tuple[List[str], in
         raise ValueError(f"Aucun chemin trouvé entre '{start_name}' et '{end_name}'")
 
 def main():
-    graph, positions, stations = load_data()
+    network = get_network()
+    graph, stations = network.csr, network.stations
     # Exemple : plus court chemin entre Abbesses (0000) et Bastille (0016)
     start_id = '0000'  # Abbesses
     end_id = '0016'    # Bastille
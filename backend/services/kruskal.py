@@ -1,5 +1,6 @@
-from utils.parser import load_data
-from typing import List, Tuple
+from services.network import NetworkSnapshot, get_network
+from utils.graphe import CSRGraph
+from typing import List, Tuple, Optional
 
 class UnionFind:
     def __init__(self, elements):
@@ -24,18 +25,33 @@ class UnionFind:
                 self.rank[xroot] += 1
         return True
 
-def kruskal_mst():
-    graph, positions, stations = load_data()
+def minimum_spanning_tree(graph) -> Tuple[List[Tuple[str, str, int]], int]:
+    """
+    Calcule l'arbre couvrant de poids minimal avec l'algorithme de Kruskal.
+
+    Args:
+        graph: Graphe au format dict {id: {voisin: poids}} ou CSRGraph
+
+    Returns:
+        Tuple contenant:
+        - Liste des arêtes (station1, station2, poids) de l'ACPM
+        - Poids total de l'arbre
+    """
     edges: List[Tuple[int, str, str]] = []  # (poids, station1, station2)
-    seen = set()
-    for s1 in graph:
-        for s2, weight in graph[s1].items():
-            if (s2, s1) not in seen:
-                edges.append((weight, s1, s2))
-                seen.add((s1, s2))
+    if isinstance(graph, CSRGraph):
+        ids = graph.ids
+        edges = [(weight, ids[u], ids[v]) for u, v, weight in graph.edges()]
+    else:
+        seen = set()
+        for s1 in graph:
+            for s2, weight in graph[s1].items():
+                if (s2, s1) not in seen:
+                    edges.append((weight, s1, s2))
+                    seen.add((s1, s2))
     # Tri des arêtes par poids croissant
     edges.sort()
-    uf = UnionFind(graph.keys())
+    vertices = graph.ids if isinstance(graph, CSRGraph) else graph.keys()
+    uf = UnionFind(vertices)
     mst = []
     total_weight = 0
     for weight, s1, s2 in edges:
@@ -44,6 +60,12 @@ def kruskal_mst():
             total_weight += weight
             if len(mst) == len(graph) - 1:
                 break
+    return mst, total_weight
+
+def kruskal_mst(network: Optional[NetworkSnapshot] = None):
+    network = network or get_network()
+    graph, stations = network.graph, network.stations
+    mst, total_weight = minimum_spanning_tree(network.csr)
     print("\n=== Arbre couvrant de poids minimal (Kruskal) ===")
     for s1, s2, w in mst:
         print(f"{stations[s1]['name']} <-> {stations[s2]['name']} : {w}")
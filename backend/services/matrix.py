@@ -0,0 +1,229 @@
+import logging
+import os
+import struct
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import config
+from services.dijkstra import INFINITY, shortest_path_tree
+from services.network import NetworkSnapshot, get_network
+from utils.graphe import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+# Valeur stockée pour les couples sans chemin
+UNREACHABLE = -1
+# En dessous de cette taille, un pool de processus coûte plus qu'il ne rapporte
+PARALLEL_THRESHOLD = 2000
+
+_MAGIC = b'METROTTM'
+_HEADER = struct.Struct('<8sIB64s')
+
+
+class TravelTimeMatrix:
+    """
+    Temps de parcours entre toutes les paires de sommets d'un CSRGraph.
+
+    times[u * n + v] contient la durée du plus court chemin de u à v
+    (UNREACHABLE si aucun chemin). Si elle est présente, next_hops[u * n + v]
+    contient le sommet qui suit u sur ce chemin, ce qui permet de
+    reconstruire l'itinéraire sans nouvelle recherche.
+    """
+
+    def __init__(self, ids: List[str], times: array, next_hops: Optional[array], fingerprint: str):
+        self.ids = ids
+        self.index = {station_id: i for i, station_id in enumerate(ids)}
+        self.size = len(ids)
+        self.times = times
+        self.next_hops = next_hops
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, graph: CSRGraph, workers: int = 0, with_next_hops: bool = True) -> 'TravelTimeMatrix':
+        """
+        Lance un Dijkstra complet depuis chaque sommet.
+
+        Args:
+            graph: Graphe CSR
+            workers: Nombre de processus (0 : un par cœur, 1 : calcul local)
+            with_next_hops: Calculer aussi la matrice des sommets suivants
+
+        Returns:
+            La matrice des temps de parcours
+        """
+        n = len(graph)
+        workers = workers or os.cpu_count() or 1
+        started = time.perf_counter()
+        if workers > 1 and n >= PARALLEL_THRESHOLD:
+            chunk = -(-n // (workers * 4))
+            ranges = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(graph, with_next_hops)) as pool:
+                blocks = list(pool.map(_compute_block, ranges))
+        else:
+            _init_worker(graph, with_next_hops)
+            blocks = [_compute_block((0, n))]
+
+        times = array('i')
+        next_hops = array('i') if with_next_hops else None
+        for block_times, block_next_hops in blocks:
+            times.extend(block_times)
+            if with_next_hops:
+                next_hops.extend(block_next_hops)
+        logger.info(f"Matrice des temps de parcours calculée ({n}x{n}) en {time.perf_counter() - started:.2f}s")
+        return cls(list(graph.ids), times, next_hops, graph.fingerprint())
+
+    def time(self, u: int, v: int) -> Optional[int]:
+        """Durée du plus court chemin de u à v, ou None si aucun chemin."""
+        value = self.times[u * self.size + v]
+        return None if value == UNREACHABLE else value
+
+    def best_pair(self, sources: Iterable[int], targets: Iterable[int]) -> Tuple[float, int, int]:
+        """
+        Meilleur couple (source, cible) : simple lecture de la matrice.
+
+        Returns:
+            Tuple (durée, source, cible), ou (INFINITY, -1, -1) si aucun chemin
+        """
+        times, n = self.times, self.size
+        targets = list(targets)
+        best = (INFINITY, -1, -1)
+        for u in sources:
+            row = u * n
+            for v in targets:
+                value = times[row + v]
+                if value != UNREACHABLE and value < best[0]:
+                    best = (value, u, v)
+        return best
+
+    def path(self, u: int, v: int) -> List[int]:
+        """Reconstruit le chemin de u à v à partir des sommets suivants."""
+        if self.next_hops is None:
+            raise ValueError("La matrice a été calculée sans les sommets suivants")
+        if self.times[u * self.size + v] == UNREACHABLE:
+            return []
+        path = [u]
+        while u != v:
+            u = self.next_hops[u * self.size + v]
+            path.append(u)
+        return path
+
+    def route(self, starts: Iterable[str], ends: Iterable[str]) -> Tuple[float, List[str], Optional[str], Optional[str]]:
+        """Même contrat que find_route(), sans aucune recherche dans le graphe."""
+        index = self.index
+        total, u, v = self.best_pair([index[s] for s in starts], [index[e] for e in ends])
+        if u == -1:
+            return INFINITY, [], None, None
+        path = [self.ids[i] for i in self.path(u, v)]
+        return total, path, path[0], path[-1]
+
+    def save(self, path: Path) -> None:
+        """Écrit la matrice dans un fichier binaire compact."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.size, self.next_hops is not None, self.fingerprint.encode('ascii')))
+            names = '\n'.join(self.ids).encode('utf-8')
+            f.write(struct.pack('<I', len(names)))
+            f.write(names)
+            self.times.tofile(f)
+            if self.next_hops is not None:
+                self.next_hops.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: Optional[str] = None) -> Optional['TravelTimeMatrix']:
+        """
+        Relit une matrice sauvegardée.
+
+        Returns:
+            La matrice, ou None si le fichier est absent, invalide ou
+            calculé pour un autre graphe que celui de l'empreinte fournie
+        """
+        try:
+            with open(path, 'rb') as f:
+                magic, size, has_next_hops, stored = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or (fingerprint and stored.decode('ascii') != fingerprint):
+                    return None
+                (names_length,) = struct.unpack('<I', f.read(4))
+                ids = f.read(names_length).decode('utf-8').split('\n')
+                times = array('i')
+                times.fromfile(f, size * size)
+                next_hops = None
+                if has_next_hops:
+                    next_hops = array('i')
+                    next_hops.fromfile(f, size * size)
+        except (OSError, EOFError, struct.error, UnicodeDecodeError):
+            return None
+        return cls(ids, times, next_hops, stored.decode('ascii'))
+
+
+_worker_graph: Optional[CSRGraph] = None
+_worker_next_hops = True
+
+
+def _init_worker(graph: CSRGraph, with_next_hops: bool) -> None:
+    global _worker_graph, _worker_next_hops
+    _worker_graph = graph
+    _worker_next_hops = with_next_hops
+
+
+def _compute_block(bounds: Tuple[int, int]) -> Tuple[array, Optional[array]]:
+    """Calcule les lignes [start, end) de la matrice dans le processus courant."""
+    graph = _worker_graph
+    n = len(graph)
+    start, end = bounds
+    times = array('i')
+    next_hops = array('i') if _worker_next_hops else None
+    for source in range(start, end):
+        dist, pred, _ = shortest_path_tree(graph, [source])
+        times.extend(UNREACHABLE if d == INFINITY else d for d in dist)
+        if next_hops is not None:
+            # Premier sommet après la source : hérité le long de la chaîne des prédécesseurs
+            first = [UNREACHABLE] * n
+            first[source] = source
+            for v in range(n):
+                if first[v] != UNREACHABLE or dist[v] == INFINITY:
+                    continue
+                chain = [v]
+                while pred[chain[-1]] != source and first[pred[chain[-1]]] == UNREACHABLE:
+                    chain.append(pred[chain[-1]])
+                top = chain[-1]
+                hop = top if pred[top] == source else first[pred[top]]
+                for u in chain:
+                    first[u] = hop
+            next_hops.extend(first)
+    return times, next_hops
+
+
+def travel_time_matrix(network: Optional[NetworkSnapshot] = None) -> TravelTimeMatrix:
+    """
+    Matrice du snapshot, relue depuis le disque si elle correspond au graphe
+    courant, sinon recalculée puis sauvegardée. Calculée une fois par version.
+    """
+    network = network or get_network()
+
+    def factory(network: NetworkSnapshot) -> TravelTimeMatrix:
+        fingerprint = network.csr.fingerprint()
+        matrix = TravelTimeMatrix.load(config.TRAVEL_TIME_MATRIX_PATH, fingerprint)
+        if matrix is None:
+            matrix = TravelTimeMatrix.build(network.csr, config.TRAVEL_TIME_MATRIX_WORKERS)
+            try:
+                matrix.save(config.TRAVEL_TIME_MATRIX_PATH)
+            except OSError as e:
+                logger.warning(f"Impossible de sauvegarder la matrice : {e}")
+        return matrix
+
+    return network.cached('travel_time_matrix', factory)
+
+
+if __name__ == '__main__':
+    # Précalcul hors ligne : python -m services.matrix
+    network = get_network()
+    matrix = TravelTimeMatrix.build(network.csr, config.TRAVEL_TIME_MATRIX_WORKERS)
+    matrix.save(config.TRAVEL_TIME_MATRIX_PATH)
+    print(f"Matrice {matrix.size}x{matrix.size} écrite dans {config.TRAVEL_TIME_MATRIX_PATH}")
@@ -0,0 +1,127 @@
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.graphe import CSRGraph
+from utils.parser import load_data
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NetworkSnapshot:
+    """
+    Vue immuable du réseau, construite une seule fois puis partagée
+    entre toutes les requêtes.
+
+    Les structures exposées (graph, positions, stations) ne doivent pas être
+    modifiées : elles sont partagées par tous les threads du processus.
+    """
+    graph: Dict[str, Dict[str, int]]
+    positions: Dict[str, Tuple[int, int]]
+    stations: Dict[str, Dict[str, Any]]
+    name_to_ids: Dict[str, List[str]]
+    version: int = 1
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, version: int = 1) -> 'NetworkSnapshot':
+        """Charge les fichiers de données et construit un nouveau snapshot."""
+        graph, positions, stations = load_data()
+        name_to_ids: Dict[str, List[str]] = {}
+        for station_id, station_data in stations.items():
+            name_to_ids.setdefault(station_data['name'], []).append(station_id)
+        return cls(graph=graph, positions=positions, stations=stations,
+                   name_to_ids=name_to_ids, version=version)
+
+    def as_tuple(self) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Tuple[int, int]], Dict[str, Dict[str, Any]]]:
+        """Retourne (graph, positions, stations), comme load_data()."""
+        return self.graph, self.positions, self.stations
+
+    @property
+    def csr(self) -> CSRGraph:
+        """Graphe au format CSR (indices entiers denses), construit à la demande."""
+        return self.cached('csr', lambda network: CSRGraph.from_dict(network.graph))
+
+    def cached(self, key: str, factory: Callable[['NetworkSnapshot'], Any]) -> Any:
+        """
+        Retourne une donnée dérivée du snapshot, calculée au premier appel.
+
+        Comme le snapshot est immuable, la valeur reste valable pendant toute
+        la durée de vie de cette version du réseau.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = factory(self)
+            return self._derived[key]
+
+
+class NetworkStore:
+    """Détient le snapshot courant et permet de le remplacer atomiquement."""
+
+    def __init__(self, snapshot: Optional[NetworkSnapshot] = None):
+        self._snapshot = snapshot
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> NetworkSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = NetworkSnapshot.build()
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self) -> NetworkSnapshot:
+        """Relit les fichiers de données et remplace le snapshot courant."""
+        with self._lock:
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            self._snapshot = NetworkSnapshot.build(version)
+            logger.info(f"Réseau rechargé (version {version})")
+            return self._snapshot
+
+    def set(self, snapshot: NetworkSnapshot) -> None:
+        """Injecte un snapshot déjà construit (tests, outils)."""
+        with self._lock:
+            self._snapshot = snapshot
+
+
+default_store = NetworkStore()
+
+
+def _current_store() -> NetworkStore:
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            return current_app.extensions.get('network', default_store)
+    except ImportError:
+        pass
+    return default_store
+
+
+def get_network() -> NetworkSnapshot:
+    """Retourne le snapshot du réseau de l'application courante."""
+    return _current_store().snapshot
+
+
+def refresh_network() -> NetworkSnapshot:
+    """Force le rechargement du réseau de l'application courante."""
+    return _current_store().refresh()
+
+
+def init_app(app, store: Optional[NetworkStore] = None) -> NetworkStore:
+    """
+    Attache un NetworkStore à l'application Flask et construit le snapshot
+    immédiatement, pour que le coût du parsing soit payé au démarrage.
+    """
+    store = store or default_store
+    app.extensions['network'] = store
+    store.snapshot
+    return store
@@ -0,0 +1,95 @@
+import random
+import pytest
+from services.network import get_network
+from services.dijkstra import (STRATEGIES, dijkstra, euclidean_heuristic,
+                               find_route, multi_source_dijkstra, shortest_path_by_name)
+from benchmarks.bench_dijkstra import reference_dijkstra
+
+@pytest.fixture
+def network():
+    return get_network()
+
+def path_length(graph, path):
+    return sum(graph[a][b] for a, b in zip(path, path[1:]))
+
+def test_dijkstra_matches_reference(network):
+    """Le moteur à prédécesseurs donne les mêmes durées que l'implémentation d'origine."""
+    ids = list(network.graph)
+    rng = random.Random(0)
+    for _ in range(200):
+        start, end = rng.choice(ids), rng.choice(ids)
+        expected, _ = reference_dijkstra(network.graph, start, end)
+        dist, path = dijkstra(network.csr, start, end)
+
+        assert dist == expected
+        assert path[0] == start and path[-1] == end
+        assert path_length(network.graph, path) == dist
+
+def test_dijkstra_same_station(network):
+    """Un trajet vers la station de départ dure 0 seconde."""
+    assert dijkstra(network.csr, '0000', '0000') == (0, ['0000'])
+
+def test_dijkstra_unreachable():
+    """Sans chemin, le contrat (inf, []) est conservé."""
+    graph = {'A': {'B': 1}, 'B': {'A': 1}, 'C': {}}
+    assert dijkstra(graph, 'A', 'C') == (float('inf'), [])
+
+def test_multi_source_matches_pairwise(network):
+    """Une recherche multi-sources équivaut au minimum sur tous les couples de quais."""
+    name_to_ids = network.name_to_ids
+    interchanges = [name for name, ids in name_to_ids.items() if len(ids) >= 3]
+    names = list(name_to_ids)
+    rng = random.Random(1)
+    for _ in range(50):
+        start_name, end_name = rng.choice(interchanges), rng.choice(names)
+        expected = min(dijkstra(network.csr, s, e)[0]
+                       for s in name_to_ids[start_name] for e in name_to_ids[end_name])
+        dist, path, start_id, end_id = multi_source_dijkstra(
+            network.csr, name_to_ids[start_name], name_to_ids[end_name])
+
+        assert dist == expected
+        assert start_id == path[0] and start_id in name_to_ids[start_name]
+        assert end_id == path[-1] and end_id in name_to_ids[end_name]
+
+def test_shortest_path_by_name_reports_platforms(network):
+    """shortest_path_by_name indique les quais de départ et d'arrivée utilisés."""
+    path, total_time, start_id, end_id = shortest_path_by_name('Châtelet', 'République', network)
+    assert network.stations[start_id]['name'] == 'Châtelet'
+    assert network.stations[end_id]['name'] == 'République'
+    assert path[0] == start_id and path[-1] == end_id
+    assert path_length(network.graph, path) == total_time
+
+    with pytest.raises(ValueError):
+        shortest_path_by_name('Station inconnue', 'Bastille', network)
+
+@pytest.mark.parametrize('strategy', sorted(STRATEGIES))
+def test_strategies_are_optimal(network, strategy):
+    """Toutes les stratégies trouvent un chemin de durée optimale."""
+    name_to_ids = network.name_to_ids
+    names = list(name_to_ids)
+    heuristic = euclidean_heuristic(network)
+    rng = random.Random(2)
+    for _ in range(100):
+        starts, ends = name_to_ids[rng.choice(names)], name_to_ids[rng.choice(names)]
+        expected, _, _, _ = multi_source_dijkstra(network.csr, starts, ends)
+        dist, path, start_id, end_id = find_route(network.csr, starts, ends, strategy, heuristic)
+
+        assert dist == expected
+        assert start_id in starts and end_id in ends
+        assert path_length(network.graph, path) == dist
+
+def test_euclidean_heuristic_is_admissible(network):
+    """h(v) ne surestime jamais le temps réel jusqu'à la cible."""
+    heuristic = euclidean_heuristic(network)
+    assert heuristic.max_speed is not None
+    csr = network.csr
+    target = csr.index['0016']
+    points = heuristic.target_points([target])
+    for station_id in csr.ids:
+        dist, _ = dijkstra(csr, station_id, '0016')
+        assert heuristic.estimate(csr.index[station_id], points) <= dist
+
+def test_unknown_strategy(network):
+    """Une stratégie inconnue est refusée."""
+    with pytest.raises(ValueError):
+        find_route(network.csr, ['0000'], ['0016'], 'teleportation')
@@ -0,0 +1,44 @@
+import pytest
+from services.network import get_network
+from services.dijkstra import dijkstra
+from services.kruskal import minimum_spanning_tree
+from services.connexite import reachable_from
+from utils.graphe import CSRGraph
+
+@pytest.fixture
+def network():
+    return get_network()
+
+def test_csr_roundtrip(network):
+    """La conversion dict -> CSR -> dict est sans perte."""
+    csr = CSRGraph.from_dict(network.graph)
+
+    assert len(csr) == len(network.graph)
+    assert csr.edges_count == sum(len(n) for n in network.graph.values()) // 2
+    assert csr.to_dict() == network.graph
+
+def test_csr_neighbors(network):
+    """Les voisins d'un sommet CSR correspondent au format dict."""
+    csr = network.csr
+    for station_id, neighbors in network.graph.items():
+        u = csr.index[station_id]
+        assert {csr.ids[v]: w for v, w in csr.neighbors(u)} == neighbors
+
+def test_dijkstra_on_csr(network):
+    """Dijkstra donne la même durée sur les deux représentations."""
+    for start, end in [('0000', '0016'), ('0001', '0300'), ('0042', '0042')]:
+        dist_dict, path_dict = dijkstra(network.graph, start, end)
+        dist_csr, path_csr = dijkstra(network.csr, start, end)
+        assert dist_csr == dist_dict
+        assert path_csr[0] == start
+        assert path_csr[-1] == end
+
+def test_kruskal_and_connexite_on_csr(network):
+    """Kruskal et le parcours de connexité acceptent le graphe CSR."""
+    mst_dict, weight_dict = minimum_spanning_tree(network.graph)
+    mst_csr, weight_csr = minimum_spanning_tree(network.csr)
+    assert weight_csr == weight_dict
+    assert len(mst_csr) == len(mst_dict)
+
+    start = next(iter(network.graph))
+    assert reachable_from(network.csr, start) == reachable_from(network.graph, start)
@@ -0,0 +1,50 @@
+import random
+import pytest
+from services.network import get_network
+from services.dijkstra import dijkstra, multi_source_dijkstra
+from services.matrix import TravelTimeMatrix
+
+@pytest.fixture(scope='module')
+def network():
+    return get_network()
+
+@pytest.fixture(scope='module')
+def matrix(network):
+    return TravelTimeMatrix.build(network.csr, workers=1)
+
+def test_matrix_matches_dijkstra(network, matrix):
+    """Chaque case de la matrice vaut la durée calculée par Dijkstra."""
+    csr = network.csr
+    rng = random.Random(0)
+    for _ in range(200):
+        u, v = rng.randrange(len(csr)), rng.randrange(len(csr))
+        dist, _ = dijkstra(csr, csr.ids[u], csr.ids[v])
+        assert matrix.time(u, v) == dist
+
+def test_matrix_paths_are_shortest(network, matrix):
+    """Les chemins reconstruits par sommets suivants ont la durée optimale."""
+    name_to_ids = network.name_to_ids
+    names = list(name_to_ids)
+    rng = random.Random(1)
+    for _ in range(100):
+        starts, ends = name_to_ids[rng.choice(names)], name_to_ids[rng.choice(names)]
+        expected, _, _, _ = multi_source_dijkstra(network.csr, starts, ends)
+        total, path, start_id, end_id = matrix.route(starts, ends)
+
+        assert total == expected
+        assert start_id in starts and end_id in ends
+        assert sum(network.graph[a][b] for a, b in zip(path, path[1:])) == total
+
+def test_matrix_save_and_load(network, matrix, tmp_path):
+    """La matrice relue depuis le disque est identique, et refusée pour un autre graphe."""
+    path = tmp_path / 'travel_times.bin'
+    matrix.save(path)
+
+    loaded = TravelTimeMatrix.load(path, network.csr.fingerprint())
+    assert loaded is not None
+    assert loaded.ids == matrix.ids
+    assert loaded.times == matrix.times
+    assert loaded.next_hops == matrix.next_hops
+
+    assert TravelTimeMatrix.load(path, '0' * 64) is None
+    assert TravelTimeMatrix.load(tmp_path / 'absent.bin') is None
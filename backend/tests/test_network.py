@@ -0,0 +1,47 @@
+import pytest
+from services.network import NetworkSnapshot, NetworkStore, get_network
+from services.dijkstra import shortest_path_by_name
+
+def test_snapshot_matches_load_data():
+    """Le snapshot expose les mêmes structures que load_data()."""
+    snapshot = NetworkSnapshot.build()
+    graph, positions, stations = snapshot.as_tuple()
+
+    assert len(graph) == len(stations)
+    assert set(positions) == set(stations)
+    for name, ids in snapshot.name_to_ids.items():
+        for station_id in ids:
+            assert stations[station_id]['name'] == name
+
+def test_store_is_shared_and_refreshable():
+    """Le store retourne toujours le même snapshot jusqu'au rechargement."""
+    store = NetworkStore()
+    first = store.snapshot
+    assert store.snapshot is first
+
+    refreshed = store.refresh()
+    assert refreshed is not first
+    assert refreshed.version == first.version + 1
+    assert store.snapshot is refreshed
+
+def test_cached_is_computed_once():
+    """Les données dérivées sont calculées une seule fois par snapshot."""
+    snapshot = get_network()
+    calls = []
+
+    def factory(network):
+        calls.append(network)
+        return len(network.graph)
+
+    assert snapshot.cached('test_count', factory) == len(snapshot.graph)
+    assert snapshot.cached('test_count', factory) == len(snapshot.graph)
+    assert len(calls) == 1
+
+def test_services_accept_injected_snapshot():
+    """Les services utilisent le snapshot qu'on leur fournit."""
+    snapshot = NetworkSnapshot.build()
+    path, total_time, start_id, end_id = shortest_path_by_name('Abbesses', 'Bastille', snapshot)
+
+    assert path[0] == start_id
+    assert path[-1] == end_id
+    assert total_time > 0
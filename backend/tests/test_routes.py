@@ -126,4 +126,22 @@ def test_shortest_path(client):
     response = client.post('/shortest-path',
                           data=json.dumps(missing_data),
                           content_type='application/json')
-    assert response.status_code == 400 
\ No newline at end of file
+    assert response.status_code == 400 
+def test_travel_time(client):
+    """Test la route GET /travel-time."""
+    response = client.get('/travel-time?from=Abbesses&to=Bastille')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['total_time'] > 0
+    assert 'start_id' in data
+    assert 'end_id' in data
+    
+    # La durée est celle de l'itinéraire complet
+    response = client.post('/itineraire',
+                          data=json.dumps({'start': 'Abbesses', 'end': 'Bastille'}),
+                          content_type='application/json')
+    assert json.loads(response.data)['total_time'] == data['total_time']
+    
+    # Station inconnue ou paramètre manquant
+    assert client.get('/travel-time?from=Inconnue&to=Bastille').status_code == 400
+    assert client.get('/travel-time?from=Abbesses').status_code == 400
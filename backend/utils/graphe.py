@@ -0,0 +1,82 @@
+import hashlib
+from array import array
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+
+class CSRGraph:
+    """
+    Graphe non orienté compact au format CSR (Compressed Sparse Row).
+
+    Les IDs de stations ("0000", "0001", ...) sont associés à des indices
+    entiers denses. Les voisins du sommet i sont
+    targets[offsets[i]:offsets[i + 1]], avec les poids correspondants
+    dans weights. Chaque arête apparaît dans les deux sens.
+    """
+
+    def __init__(self, ids: Sequence[str], offsets: Sequence[int],
+                 targets: Sequence[int], weights: Sequence[int]):
+        self.ids: List[str] = list(ids)
+        self.index: Dict[str, int] = {station_id: i for i, station_id in enumerate(self.ids)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_dict(cls, graph: Dict[str, Dict[str, int]]) -> 'CSRGraph':
+        """
+        Construit un CSRGraph depuis le format dict de parse_metro_file.
+
+        Args:
+            graph: Dictionnaire {id_station: {id_voisin: temps}}
+
+        Returns:
+            Le graphe au format CSR
+        """
+        ids = list(graph)
+        index = {station_id: i for i, station_id in enumerate(ids)}
+        offsets = array('i', [0])
+        targets = array('i')
+        weights = array('i')
+        for station_id in ids:
+            for neighbor, weight in graph[station_id].items():
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(ids, offsets, targets, weights)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Reconstruit le format dict {id_station: {id_voisin: temps}}."""
+        ids, offsets, targets, weights = self.ids, self.offsets, self.targets, self.weights
+        return {
+            ids[u]: {ids[targets[k]]: weights[k] for k in range(offsets[u], offsets[u + 1])}
+            for u in range(len(ids))
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edges_count(self) -> int:
+        """Nombre d'arêtes non orientées."""
+        return len(self.targets) // 2
+
+    def fingerprint(self) -> str:
+        """Empreinte SHA-256 du contenu du graphe (IDs, adjacence, poids)."""
+        digest = hashlib.sha256('\n'.join(self.ids).encode('utf-8'))
+        for buffer in (self.offsets, self.targets, self.weights):
+            digest.update(array('i', buffer).tobytes())
+        return digest.hexdigest()
+
+    def neighbors(self, u: int) -> Iterator[Tuple[int, int]]:
+        """Itère sur les couples (voisin, poids) du sommet d'indice u."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Itère une seule fois sur chaque arête (u, v, poids) avec u < v."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(len(self.ids)):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if u < v:
+                    yield u, v, weights[k]